@@ -1,4 +1,4 @@
-from .connectors import AzureSQLConnector, PostgreSQLConnector, OdbcConnector, SnowflakeConnector, DatabricksConnector
+from .connectors import AzureSQLConnector, PostgreSQLConnector, OdbcConnector, SnowflakeConnector, DatabricksConnector, PooledConnector
 from .client import DatabaseClient
 from .entities import TableColumn, Table
 from .indexer import DatabaseIndexer
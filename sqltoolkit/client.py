@@ -2,26 +2,62 @@ import json
 import pandas as pd
 import warnings
 from sqltoolkit import sql_queries
+from sqltoolkit.connectors import PooledConnector, is_connection_error
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 warnings.filterwarnings('ignore')
+
+# pandas.api.types.infer_dtype results for object columns holding date/time values.
+_DATETIME_INFERRED_TYPES = {"date", "datetime", "datetime64", "time"}
   
 class DatabaseClient:  
     def __init__(self, connector):  
         self.connector = connector  
-        self.connection = self.connector.get_conn()
+        # Pooled connectors check a connection out per query instead of pinning one.
+        self.connection = None if isinstance(connector, PooledConnector) else self.connector.get_conn()
   
     def _read_sql(self, query: str) -> pd.DataFrame:
-        if hasattr(self.connection, "run_query"):
-            return self.connection.run_query(query)
-        return pd.read_sql(query, self.connection)
+        if self.connection is not None:
+            return self._read_sql_from(self.connection, query)
+
+        conn = self.connector.get_conn()
+        try:
+            return self._read_sql_from(conn, query)
+        except Exception as e:
+            if is_connection_error(e):
+                conn.invalidate()
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _read_sql_from(connection, query: str) -> pd.DataFrame:
+        if hasattr(connection, "run_query"):
+            return connection.run_query(query)
+        return pd.read_sql(query, connection)
   
     @staticmethod  
     def convert_datetime_columns_to_string(df: pd.DataFrame) -> pd.DataFrame:  
-        for column in df.columns:  
-            if pd.api.types.is_datetime64_any_dtype(df[column]) or any(isinstance(x, (datetime.date, datetime.time)) for x in df[column] if x is not None):  
-                df[column] = df[column].astype(str)  
+        # datetime64 columns are formatted by pandas' vectorized astype(str).
+        for column in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+            df[column] = DatabaseClient._to_string_keep_nulls(df[column])
+        # Drivers such as pyodbc return DATE/TIME values as Python objects, so object
+        # columns are classified with the C-level infer_dtype; only "mixed" columns
+        # still need a Python scan for date/time values.
+        for column in df.select_dtypes(include=["object"]).columns:
+            inferred = pd.api.types.infer_dtype(df[column], skipna=True)
+            if inferred in _DATETIME_INFERRED_TYPES or (
+                inferred.startswith("mixed")
+                and any(isinstance(x, (datetime.date, datetime.time)) for x in df[column] if x is not None)
+            ):
+                df[column] = DatabaseClient._to_string_keep_nulls(df[column])
         return df  
+
+    @staticmethod
+    def _to_string_keep_nulls(series: pd.Series) -> pd.Series:
+        # astype(str) would turn NaT/None into the literal strings "NaT"/"None".
+        return series.astype(str).astype(object).where(series.notna(), None)
   
     def list_database_tables(self) -> str:
         query = sql_queries.get_query(self.connector.type, 'list_database_tables')
@@ -44,15 +80,38 @@ class DatabaseClient:
         df = self.convert_datetime_columns_to_string(df)  
         return df.to_markdown()  
   
-    def get_column_values(self, table_name: str, column_name: str) -> str:  
+    def _column_values_records(self, table_name: str, column_name: str, raise_errors: bool = False) -> list:
         query = sql_queries.get_query(self.connector.type, 'get_column_values', table_name=table_name, column_name=column_name)
         try:  
             df = self._read_sql(query)
             df = self.convert_datetime_columns_to_string(df)  
-            return json.dumps(df.to_dict(orient='records'))
+            return df.to_dict(orient='records')
         except Exception as e:
+            if raise_errors:
+                raise
             print(e)
-            return json.dumps([{column_name:None}])
+            return [{column_name:None}]
+
+    def get_column_values(self, table_name: str, column_name: str, raise_errors: bool = False) -> str:  
+        """
+        Distinct values of a column. Failures return `[{column_name: None}]` unless
+        `raise_errors` is set, so callers that cache results can tell them apart.
+        """
+        return json.dumps(self._column_values_records(table_name, column_name, raise_errors))
+
+    def get_columns_values(self, table_name: str, column_names: list, raise_errors: bool = False) -> str:
+        """
+        Distinct values for several columns of a table, keyed by column name.
+        With a pooled connector the per-column queries run concurrently.
+        """
+        column_names = list(column_names)
+        workers = min(len(column_names), self.connector.pool.size()) if isinstance(self.connector, PooledConnector) else 1
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                records = list(executor.map(lambda column: self._column_values_records(table_name, column, raise_errors), column_names))
+        else:
+            records = [self._column_values_records(table_name, column, raise_errors) for column in column_names]
+        return json.dumps(dict(zip(column_names, records)))
     
     def get_available_tools(self) -> str:
         return {
@@ -1,18 +1,83 @@
 # my_module/sample_class.py
 import struct
+import threading
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 import pandas as pd
 import pyodbc
 import requests
 import snowflake.connector
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from azure.identity import DefaultAzureCredential
 import psycopg2
+import psycopg2.extensions
 from psycopg2 import OperationalError
+from sqlalchemy.pool import QueuePool
+
+SQL_COPT_SS_ACCESS_TOKEN = 1256
+AZURE_SQL_TOKEN_SCOPE = "https://database.windows.net/.default"
+
+# DB-API errors raised when the underlying connection is dead rather than the query being wrong.
+CONNECTION_ERRORS = (
+    pyodbc.InterfaceError,
+    pyodbc.OperationalError,
+    psycopg2.InterfaceError,
+    psycopg2.OperationalError,
+    snowflake.connector.errors.InterfaceError,
+    snowflake.connector.errors.OperationalError,
+)
+
+# SQLSTATEs for statement timeouts/cancellations: ODBC's query timeout (HYT00) and
+# PostgreSQL's query_canceled (statement_timeout). HYT01, the ODBC connection timeout,
+# is left out because it does mean the server stopped responding.
+QUERY_TIMEOUT_SQLSTATES = frozenset({"HYT00", "57014"})
+
+_CREDENTIAL: Optional[DefaultAzureCredential] = None
+_CREDENTIAL_LOCK = threading.Lock()
+
+
+def _get_credential() -> DefaultAzureCredential:
+    """Return the process-wide credential so MSAL's own token cache is reused."""
+    global _CREDENTIAL
+    with _CREDENTIAL_LOCK:
+        if _CREDENTIAL is None:
+            _CREDENTIAL = DefaultAzureCredential(exclude_interactive_browser_credential=False)
+        return _CREDENTIAL
+
+
+def _is_query_timeout(exc: BaseException) -> bool:
+    if isinstance(exc, psycopg2.extensions.QueryCanceledError):
+        return True
+    if isinstance(exc, pyodbc.Error):
+        return bool(exc.args) and exc.args[0] in QUERY_TIMEOUT_SQLSTATES
+    return getattr(exc, "pgcode", None) in QUERY_TIMEOUT_SQLSTATES
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """
+    Return True when `exc` (or an exception it was raised from, e.g. pandas'
+    DatabaseError wrapper) signals a broken connection. Query timeouts and
+    cancellations are raised as OperationalError too but leave the connection usable.
+    """
+    while exc is not None:
+        if isinstance(exc, CONNECTION_ERRORS):
+            return not _is_query_timeout(exc)
+        exc = exc.__cause__
+    return False
 
 
 class AzureSQLConnector:
+    # Refresh the Entra ID token this many seconds before it actually expires.
+    EXPIRY_BUFFER = 300
+    # resource -> (attrs_before for pyodbc.connect, expires_on epoch seconds). The dict is
+    # shared by every connect and never mutated; a refresh replaces it. pyodbc requires
+    # a real dict here, so it cannot be wrapped in a MappingProxyType.
+    _TOKEN_CACHE: Dict[str, Tuple[Dict[int, bytes], int]] = {}
+    _TOKEN_LOCK = threading.Lock()
+
     def __init__(self, server: str, database: str, use_entra_id: bool = True, username: str = None, password: str = None):
         self.type = 'AZURE_SQL'
         self.use_entra_id = use_entra_id
@@ -23,14 +88,31 @@ class AzureSQLConnector:
                 raise ValueError("Username and password must be provided for user password authentication.")
             self.connection_string = f'Driver={{ODBC Driver 18 for SQL Server}};Server=tcp:{server},1433;Database={database};Uid={username};Pwd={password};Encrypt=yes;TrustServerCertificate=no;Connection Timeout=30;'
 
+    @classmethod
+    def _get_attrs_before(cls, resource: str = AZURE_SQL_TOKEN_SCOPE) -> Dict[int, bytes]:
+        """
+        Return the pyodbc `attrs_before` carrying the packed access token for `resource`,
+        only calling the credential when the cached token is missing or within
+        EXPIRY_BUFFER of expiring.
+        """
+        with cls._TOKEN_LOCK:
+            cached = cls._TOKEN_CACHE.get(resource)
+            if cached is not None and cached[1] - time.time() > cls.EXPIRY_BUFFER:
+                return cached[0]
+
+            access_token = _get_credential().get_token(resource)
+            token_bytes = access_token.token.encode("UTF-16-LE")
+            # Length-prefixed UTF-16-LE token; a fixed "<I" format avoids building a new
+            # struct format for every token length.
+            token_struct = struct.pack("<I", len(token_bytes)) + token_bytes
+            attrs_before = {SQL_COPT_SS_ACCESS_TOKEN: token_struct}
+            cls._TOKEN_CACHE[resource] = (attrs_before, access_token.expires_on)
+            return attrs_before
+
     def get_conn(self):
         try:
             if self.use_entra_id:
-                credential = DefaultAzureCredential(exclude_interactive_browser_credential=False)
-                token_bytes = credential.get_token("https://database.windows.net/.default").token.encode("UTF-16-LE")
-                token_struct = struct.pack(f'<I{len(token_bytes)}s', len(token_bytes), token_bytes)
-                SQL_COPT_SS_ACCESS_TOKEN = 1256
-                conn = pyodbc.connect(self.connection_string, attrs_before={SQL_COPT_SS_ACCESS_TOKEN: token_struct})
+                conn = pyodbc.connect(self.connection_string, attrs_before=self._get_attrs_before())
             else:
                 conn = pyodbc.connect(self.connection_string)
             return conn
@@ -89,6 +171,8 @@ class SnowflakeConnector:
         }
         if role:
             self.connection_params['role'] = role
+        # Keep idle sessions alive so long-lived (pooled) connections are not dropped by Snowflake.
+        self.connection_params['client_session_keep_alive'] = True
         # Include any additional optional parameters
         self.connection_params.update(kwargs)
     
@@ -103,12 +187,43 @@ class SnowflakeConnector:
             raise RuntimeError(f"Error connecting to Snowflake: {e}")
 
 
+# Databricks JSON_ARRAY results encode every value as a string; columns with these
+# manifest type names are converted to typed pandas columns, the rest stay as objects.
+_DATABRICKS_INTEGER_TYPES = {"BYTE", "SHORT", "INT", "LONG"}
+_DATABRICKS_FLOAT_TYPES = {"FLOAT", "DOUBLE"}
+_DATABRICKS_DATETIME_TYPES = {"DATE", "TIMESTAMP", "TIMESTAMP_NTZ"}
+
+
+def _databricks_column(values: tuple, type_name: Optional[str]) -> pd.Series:
+    type_name = (type_name or "").upper()
+    if type_name in _DATABRICKS_INTEGER_TYPES:
+        return pd.Series(pd.array([None if v is None else int(v) for v in values], dtype="Int64"))
+    if type_name in _DATABRICKS_FLOAT_TYPES:
+        return pd.Series(values, dtype=object).astype("float64")
+    if type_name == "BOOLEAN":
+        return pd.Series(pd.array([None if v is None else str(v).lower() == "true" for v in values], dtype="boolean"))
+    series = pd.Series(values, dtype=object)
+    if type_name in _DATABRICKS_DATETIME_TYPES:
+        try:
+            # ISO8601 parses each value on its own, so rows whose fractional-second
+            # precision differs from the first row still parse.
+            return pd.to_datetime(series, format="ISO8601")
+        except (ValueError, OverflowError):
+            # Sentinel dates such as 9999-12-31 fall outside the datetime64[ns] range
+            # (OutOfBoundsDatetime is a ValueError); keep the column as strings.
+            return series
+    return series
+
+
 class DatabricksSQLConnection:
     """
     Lightweight connection object that proxies Databricks SQL Statement Execution
     responses into a pandas DataFrame so the rest of the toolkit can stay unchanged.
     """
 
+    INITIAL_POLL_DELAY = 0.1
+    POLL_BACKOFF = 1.8
+
     def __init__(
         self,
         host: str,
@@ -120,6 +235,7 @@ class DatabricksSQLConnection:
         poll_interval: float = 2.0,
         max_poll_attempts: Optional[int] = 120,
         request_timeout: int = 60,
+        poll_timeout: Optional[float] = None,
     ):
         if not host.startswith("http://") and not host.startswith("https://"):
             host = f"https://{host}"
@@ -132,23 +248,54 @@ class DatabricksSQLConnection:
         self.poll_interval = poll_interval
         self.max_poll_attempts = max_poll_attempts
         self.request_timeout = request_timeout
+        # Polling is budgeted on wall time; by default keep the old attempts * interval budget.
+        if poll_timeout is None and max_poll_attempts is not None:
+            poll_timeout = max_poll_attempts * poll_interval
+        self.poll_timeout = poll_timeout
+
+        # One keep-alive session per connection so submit and poll calls reuse TCP/TLS.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]),
+        )
+        self._session.mount(self.host, adapter)
+        self._session.headers.update(self._headers())
 
     def cursor(self):
         return DatabricksCursor(self)
 
     def close(self):
-        """No persistent connection to close."""
+        """Release the pooled HTTP connections held by the session."""
+        self._session.close()
+
+    def commit(self):
+        """Statements run in auto-commit mode; present for DB-API/pool compatibility."""
+
+    def rollback(self):
+        """Statements run in auto-commit mode; present for DB-API/pool compatibility."""
 
     def run_query(self, statement: str) -> pd.DataFrame:
-        final_payload = self._execute_statement(statement)
-        result = final_payload.get("result") or {}
-        schema = result.get("manifest", {}).get("schema") or []
-        columns = [col.get("name") for col in schema]
-        data_array = result.get("data_array") or []
+        result = self._execute_statement(statement)
+        columns, rows = result["columns"], result["rows"]
         if not columns:
             # If Databricks returns an empty schema, we still produce an empty DataFrame.
             return pd.DataFrame()
-        return pd.DataFrame(data_array, columns=columns)
+        # Transpose once and build each column with the dtype from the manifest
+        # instead of letting pandas infer types row by row.
+        column_values = list(zip(*rows)) if rows else [()] * len(columns)
+        df = pd.DataFrame({
+            position: _databricks_column(values, type_name)
+            for position, (values, type_name) in enumerate(zip(column_values, result["types"]))
+        })
+        df.columns = columns
+        return df
+
+    def run_query_rows(self, statement: str) -> Tuple[List[str], List[list]]:
+        """Execute `statement` and return `(columns, data_array)` without building a DataFrame."""
+        result = self._execute_statement(statement)
+        return result["columns"], result["rows"]
 
     def execute(self, statement: str):
         """Helper so pandas.io.sql can call connection.execute directly."""
@@ -167,13 +314,27 @@ class DatabricksSQLConnection:
         initial = self._submit_statement(statement)
         status = (initial.get("status") or {}).get("state")
         if status == "SUCCEEDED":
-            return initial
+            return self._parse_result(initial)
 
         statement_id = initial.get("statement_id")
         if not statement_id:
             raise RuntimeError("Databricks response missing statement_id.")
 
-        return self._poll_for_completion(statement_id)
+        return self._parse_result(self._poll_for_completion(statement_id))
+
+    @staticmethod
+    def _parse_result(payload: dict) -> dict:
+        """Reduce a statement response to `{"columns": [...], "types": [...], "rows": [...]}`."""
+        result = payload.get("result") or {}
+        schema = result.get("manifest", {}).get("schema") or []
+        columns = [col.get("name") for col in schema]
+        if not columns:
+            return {"columns": [], "types": [], "rows": []}
+        return {
+            "columns": columns,
+            "types": [col.get("type_name") for col in schema],
+            "rows": result.get("data_array") or [],
+        }
 
     def _submit_statement(self, statement: str) -> dict:
         payload = {
@@ -189,25 +350,26 @@ class DatabricksSQLConnection:
         if self.schema:
             payload["schema"] = self.schema
 
-        response = requests.post(
+        response = self._session.post(
             f"{self.host}/api/2.0/sql/statements",
-            headers=self._headers(),
             json=payload,
             timeout=self.request_timeout,
         )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def _poll_for_completion(self, statement_id: str) -> dict:
-        attempts = 0
+        # Start polling quickly so short queries return right after they finish,
+        # then back off exponentially up to poll_interval between requests.
+        delay = self.INITIAL_POLL_DELAY
+        deadline = None if self.poll_timeout is None else time.monotonic() + self.poll_timeout
         while True:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.host}/api/2.0/sql/statements/{statement_id}",
-                headers=self._headers(),
                 timeout=self.request_timeout,
             )
             response.raise_for_status()
-            payload = response.json()
+            payload = orjson.loads(response.content)
             status = (payload.get("status") or {}).get("state")
 
             if status == "SUCCEEDED":
@@ -218,10 +380,14 @@ class DatabricksSQLConnection:
                 ).get("message", "Unknown Databricks error.")
                 raise RuntimeError(f"Databricks query failed: {message}")
 
-            attempts += 1
-            if self.max_poll_attempts is not None and attempts >= self.max_poll_attempts:
-                raise RuntimeError("Timed out waiting for Databricks query to finish.")
-            time.sleep(self.poll_interval)
+            sleep_for = delay
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError("Timed out waiting for Databricks query to finish.")
+                sleep_for = min(delay, remaining)
+            time.sleep(sleep_for)
+            delay = min(delay * self.POLL_BACKOFF, self.poll_interval)
 
 
 class DatabricksCursor:
@@ -231,22 +397,21 @@ class DatabricksCursor:
 
     def __init__(self, connection: DatabricksSQLConnection):
         self.connection = connection
-        self._df: Optional[pd.DataFrame] = None
+        self._columns: List[str] = []
+        self._rows: List[list] = []
         self.description: Optional[List[tuple]] = None
 
     def execute(self, statement: str):
-        self._df = self.connection.run_query(statement)
-        columns = list(self._df.columns) if self._df is not None else []
-        self.description = [(col, None, None, None, None, None, None) for col in columns]
+        self._columns, self._rows = self.connection.run_query_rows(statement)
+        self.description = [(col, None, None, None, None, None, None) for col in self._columns]
         return self
 
     def fetchall(self):
-        if self._df is None or self._df.empty:
-            return []
-        return [tuple(row) for row in self._df.itertuples(index=False, name=None)]
+        return list(map(tuple, self._rows))
 
     def close(self):
-        self._df = None
+        self._columns = []
+        self._rows = []
         self.description = None
 
 
@@ -262,6 +427,7 @@ class DatabricksConnector:
         poll_interval: float = 2.0,
         max_poll_attempts: Optional[int] = 120,
         request_timeout: int = 60,
+        poll_timeout: Optional[float] = None,
     ):
         """
         Connector leveraging the Databricks SQL Statement Execution REST API.
@@ -284,7 +450,35 @@ class DatabricksConnector:
             "poll_interval": poll_interval,
             "max_poll_attempts": max_poll_attempts,
             "request_timeout": request_timeout,
+            "poll_timeout": poll_timeout,
         }
 
     def get_conn(self) -> DatabricksSQLConnection:
         return DatabricksSQLConnection(**self.connection_kwargs)
+
+
+class PooledConnector:
+    def __init__(self, connector, pool_size: int = 5, max_overflow: int = 0, pool_timeout: int = 120, pool_recycle: int = -1):
+        """
+        Wrap any connector with a bounded, thread-safe connection pool.
+
+        `get_conn` returns a pooled connection proxy; calling `close()` on it hands the
+        physical connection back to the pool instead of closing it, and `invalidate()`
+        discards it so the next checkout opens a fresh one.
+        """
+        self.type = connector.type
+        self.connector = connector
+        self.pool = QueuePool(
+            creator=connector.get_conn,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            timeout=pool_timeout,
+            recycle=pool_recycle,
+        )
+
+    def get_conn(self):
+        return self.pool.connect()
+
+    def dispose(self):
+        """Close every idle connection held by the pool."""
+        self.pool.dispose()
@@ -0,0 +1,31 @@
+import decimal
+from typing import Any
+
+import orjson
+import pandas as pd
+
+
+def json_default(obj: Any) -> Any:
+    """Serialize the values orjson does not handle natively (pandas NA, Decimal, Timestamp)."""
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(payload: Any) -> bytes:
+    """
+    Serialize `payload` (typically DataFrame.to_dict output) with orjson.
+
+    Floats are written with full round-trip precision, unlike DataFrame.to_json which
+    rounds to 10 decimal places. Naive datetimes are emitted without an offset, like
+    the naive Timestamps handled in `json_default`.
+    """
+    return orjson.dumps(
+        payload,
+        default=json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, Optional, Type
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
@@ -15,9 +19,12 @@ from sqltoolkit import (
     DatabaseClient,
     DatabricksConnector,
     OdbcConnector,
+    PooledConnector,
     PostgreSQLConnector,
     SnowflakeConnector,
 )
+from sqltoolkit.connectors import is_connection_error
+from sqltoolkit.serialization import dumps_json
 
 load_dotenv()
 
@@ -32,11 +39,33 @@ mcp = FastMCP(
     ),
 )
 
-_CONFIG: Dict[str, Any] = {}
+_CONNECTOR_MAP: Mapping[str, Type] = MappingProxyType({
+    "AZURE_SQL": AzureSQLConnector,
+    "POSTGRESQL": PostgreSQLConnector,
+    "ODBC": OdbcConnector,
+    "SNOWFLAKE": SnowflakeConnector,
+    "DATABRICKS": DatabricksConnector,
+})
+# SQL_CONNECTOR_CONFIG keys forwarded to PooledConnector instead of the connector;
+# raise pool_size to allow more concurrent queries per process.
+_POOL_OPTIONS = frozenset({"pool_size", "max_overflow", "pool_timeout", "pool_recycle"})
+
+_CONFIG: Mapping[str, Any] = MappingProxyType({})
+# (connector class, constructor kwargs, pool kwargs) resolved once from SQL_CONNECTOR_CONFIG.
+_CONNECTOR_SPEC: Optional[Tuple[Type, Mapping[str, Any], Mapping[str, Any]]] = None
 _CLIENT: Optional[DatabaseClient] = None
+# Tools run on worker threads, so guard creation/reset of the shared client.
+_CLIENT_LOCK = threading.Lock()
 
+# Schema metadata rarely changes during an agent session, so list_tables,
+# table_schema and column_values results are kept for SQL_METADATA_CACHE_TTL seconds (0 disables).
+_METADATA_CACHE_TTL = float(os.getenv("SQL_METADATA_CACHE_TTL", "300"))
+_METADATA_CACHE_MAXSIZE = 256
+_METADATA_CACHE: Dict[Tuple[Any, ...], Tuple[float, str]] = {}
+_METADATA_CACHE_LOCK = threading.Lock()
 
-def _load_config() -> Dict[str, Any]:
+
+def _load_config() -> Mapping[str, Any]:
     global _CONFIG
     if _CONFIG:
         return _CONFIG
@@ -46,49 +75,122 @@ def _load_config() -> Dict[str, Any]:
         raise RuntimeError("SQL_CONNECTOR_CONFIG environment variable is not set.")
 
     try:
-        _CONFIG = json.loads(config_raw)
+        _CONFIG = MappingProxyType(json.loads(config_raw))
     except json.JSONDecodeError as exc:
         raise RuntimeError("SQL_CONNECTOR_CONFIG must be valid JSON.") from exc
 
     return _CONFIG
 
 
-def _connector_from_config(config: Dict[str, Any]):
+def _connector_spec() -> Tuple[Type, Mapping[str, Any], Mapping[str, Any]]:
+    global _CONNECTOR_SPEC
+    if _CONNECTOR_SPEC is not None:
+        return _CONNECTOR_SPEC
+
+    config = _load_config()
     connector_type = (config.get("type") or "").upper()
     if not connector_type:
         raise ValueError("Connector configuration must include a 'type' field.")
 
-    connector_map: Dict[str, Type] = {
-        "AZURE_SQL": AzureSQLConnector,
-        "POSTGRESQL": PostgreSQLConnector,
-        "ODBC": OdbcConnector,
-        "SNOWFLAKE": SnowflakeConnector,
-        "DATABRICKS": DatabricksConnector,
-    }
-
-    connector_cls = connector_map.get(connector_type)
+    connector_cls = _CONNECTOR_MAP.get(connector_type)
     if connector_cls is None:
         raise ValueError(f"Unsupported connector type '{connector_type}'.")
 
-    kwargs = {k: v for k, v in config.items() if k != "type"}
-    return connector_cls(**kwargs)
+    kwargs = MappingProxyType(
+        {k: v for k, v in config.items() if k != "type" and k not in _POOL_OPTIONS}
+    )
+    pool_kwargs = MappingProxyType({k: v for k, v in config.items() if k in _POOL_OPTIONS})
+    _CONNECTOR_SPEC = (connector_cls, kwargs, pool_kwargs)
+    return _CONNECTOR_SPEC
+
+
+def _build_connector():
+    connector_cls, kwargs, pool_kwargs = _connector_spec()
+    return PooledConnector(connector_cls(**kwargs), **pool_kwargs)
+
+
+# Resolve the configuration at import so tool calls only construct the client;
+# errors are logged here and raised again from the first tool call.
+try:
+    _connector_spec()
+except (RuntimeError, ValueError) as exc:
+    logger.error("Invalid SQL_CONNECTOR_CONFIG: %s", exc)
 
 
 def _get_client() -> DatabaseClient:
     global _CLIENT
-    if _CLIENT is None:
-        config = _load_config()
-        connector = _connector_from_config(config)
-        _CLIENT = DatabaseClient(connector)
-    return _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = DatabaseClient(_build_connector())
+        return _CLIENT
 
 
 def _reset_client():
     global _CLIENT
-    _CLIENT = None
+    with _CLIENT_LOCK:
+        if _CLIENT is not None and isinstance(_CLIENT.connector, PooledConnector):
+            _CLIENT.connector.dispose()
+        _CLIENT = None
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE.clear()
+
+
+def _call_client(method: str, *args: Any, **kwargs: Any):
+    """Invoke a DatabaseClient method; meant to run via asyncio.to_thread."""
+    return getattr(_get_client(), method)(*args, **kwargs)
+
+
+def _cached_call(
+    method: str,
+    *args: Any,
+    cache_if: Optional[Callable[[str], bool]] = None,
+    **kwargs: Any,
+) -> str:
+    """
+    Like _call_client, but serves repeated calls from the metadata TTL cache.
+    Exceptions propagate uncached, as do results for which `cache_if` returns False.
+    """
+    if _METADATA_CACHE_TTL <= 0:
+        return _call_client(method, *args, **kwargs)
+
+    key = (method, *args, *sorted(kwargs.items()))
+    with _METADATA_CACHE_LOCK:
+        entry = _METADATA_CACHE.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+    result = _call_client(method, *args, **kwargs)
+    if cache_if is not None and not cache_if(result):
+        return result
+    with _METADATA_CACHE_LOCK:
+        if key not in _METADATA_CACHE and len(_METADATA_CACHE) >= _METADATA_CACHE_MAXSIZE:
+            # Evict the oldest entry; dicts keep insertion order.
+            _METADATA_CACHE.pop(next(iter(_METADATA_CACHE)))
+        _METADATA_CACHE[key] = (time.monotonic() + _METADATA_CACHE_TTL, result)
+    return result
+
+
+def _run_query(sql: str, limit: Optional[int], columnar: bool = False) -> str:
+    client = _get_client()
+    df = client._read_sql(sql)  # pylint: disable=protected-access
+    df = client.convert_datetime_columns_to_string(df)
+    return _frame_response(df, limit=limit, columnar=columnar)
+
+
+def _handle_error(exc: Exception):
+    """
+    Drop the cached client only when its pinned connection died. Pooled clients
+    already invalidated the broken connection in DatabaseClient._read_sql, so the
+    pool (and its healthy connections) is kept.
+    """
+    client = _CLIENT
+    if client is None or isinstance(client.connector, PooledConnector):
+        return
+    if is_connection_error(exc):
+        _reset_client()
 
 
-def _frame_response(df, *, limit: Optional[int] = None) -> str:
+def _frame_response(df, *, limit: Optional[int] = None, columnar: bool = False) -> str:
     if limit is not None and limit > 0:
         limited_df = df.head(limit)
         limited = len(df.index) > len(limited_df.index)
@@ -96,75 +198,115 @@ def _frame_response(df, *, limit: Optional[int] = None) -> str:
     else:
         limited = False
 
-    rows = df.to_dict(orient="records")
-    payload = {
-        "rowCount": len(df.index),
-        "rows": rows,
-        "limited": limited,
-    }
-    return json.dumps(payload)
+    if columnar:
+        # Column names appear once instead of being repeated in every row object.
+        payload = {
+            "rowCount": len(df.index),
+            "columns": df.columns.tolist(),
+            "data": df.values.tolist(),
+            "limited": limited,
+        }
+    else:
+        payload = {
+            "rowCount": len(df.index),
+            "rows": df.to_dict(orient="records"),
+            "limited": limited,
+        }
+    return dumps_json(payload).decode("utf-8")
 
 
 @mcp.tool
-def list_tables() -> str:
+async def list_tables() -> str:
     """Return the available tables for the configured connector."""
     try:
-        client = _get_client()
-        return client.list_database_tables()
+        return await asyncio.to_thread(_cached_call, "list_database_tables")
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception("Failed to list tables: %s", exc)
-        _reset_client()
+        _handle_error(exc)
         return f"Failed to list tables: {exc}"
 
 
 @mcp.tool
-def table_schema(table_name: str) -> str:
+async def table_schema(table_name: str) -> str:
     """Return column metadata for the specified table."""
     if not table_name:
         return "Provide a table name."
 
     try:
-        client = _get_client()
-        return client.get_table_schema(table_name)
+        return await asyncio.to_thread(_cached_call, "get_table_schema", table_name)
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception("Failed to fetch schema for %s: %s", table_name, exc)
-        _reset_client()
+        _handle_error(exc)
         return f"Failed to fetch schema for {table_name}: {exc}"
 
 
 @mcp.tool
-def query_sql(sql: str, limit: int = 500) -> str:
-    """Execute a read-only SQL query and return JSON rows."""
+async def query_sql(sql: str, limit: int = 500, columnar: bool = False) -> str:
+    """
+    Execute a read-only SQL query and return JSON rows.
+
+    Set `columnar` to return `columns` plus a `data` list of row arrays instead of
+    one object per row, which is much smaller for wide results.
+    """
     if not sql or not sql.strip():
         return "SQL query is empty. Provide a valid SQL statement."
 
     try:
-        client = _get_client()
-        df = client._read_sql(sql)  # pylint: disable=protected-access
-        df = client.convert_datetime_columns_to_string(df)
-        return _frame_response(df, limit=limit)
+        return await asyncio.to_thread(_run_query, sql, limit, columnar)
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception("SQL query failed: %s", exc)
-        _reset_client()
+        _handle_error(exc)
         return f"Query failed: {exc}"
 
 
 @mcp.tool
-def column_values(table_name: str, column_name: str) -> str:
-    """Return distinct column values to help with filter construction."""
-    if not table_name or not column_name:
-        return "Provide both table_name and column_name."
+async def column_values(
+    table_name: str, column_name: str = "", column_names: Optional[List[str]] = None
+) -> str:
+    """
+    Return distinct column values to help with filter construction.
+
+    Pass `column_names` to fetch several columns of the same table in one call; the
+    result is then an object keyed by column name.
+    """
+    if not table_name or not (column_name or column_names):
+        return "Provide table_name and either column_name or column_names."
 
     try:
-        client = _get_client()
-        return client.get_column_values(table_name, column_name)
+        if column_names:
+            return await asyncio.to_thread(
+                _cached_call,
+                "get_columns_values",
+                table_name,
+                tuple(column_names),
+                raise_errors=True,
+            )
+        # get_column_values reports failures as [{column_name: null}]; keep that
+        # response for the caller but don't cache it.
+        fallback = json.dumps([{column_name: None}])
+        return await asyncio.to_thread(
+            _cached_call,
+            "get_column_values",
+            table_name,
+            column_name,
+            cache_if=lambda result: result != fallback,
+        )
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception(
-            "Failed to fetch column values for %s.%s: %s", table_name, column_name, exc
+            "Failed to fetch column values for %s.%s: %s",
+            table_name,
+            column_names or column_name,
+            exc,
         )
-        _reset_client()
+        _handle_error(exc)
         return f"Failed to fetch column values: {exc}"
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional and unavailable on Windows
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run(transport="http", host="127.0.0.1", port=9000)
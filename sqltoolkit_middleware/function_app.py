@@ -5,7 +5,8 @@ import json
 import logging
 import os
 import uuid
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple, Type
 
 from sqltoolkit import (
     DatabaseClient,
@@ -14,57 +15,89 @@ from sqltoolkit import (
     OdbcConnector,
     SnowflakeConnector,
     DatabricksConnector,
+    PooledConnector,
 )
+from sqltoolkit.connectors import is_connection_error
+from sqltoolkit.serialization import dumps_json
 
 app = func.FunctionApp()
 
-_CONNECTOR_CONFIG_RAW = os.environ.get("SQL_CONNECTOR_CONFIG")
-_CONNECTOR_CONFIG: Dict[str, Any] = {}
-if _CONNECTOR_CONFIG_RAW:
-    try:
-        _CONNECTOR_CONFIG = json.loads(_CONNECTOR_CONFIG_RAW)
-    except json.JSONDecodeError as exc:
-        logging.error("Failed to parse SQL_CONNECTOR_CONFIG: %s", exc)
-
-_SQL_CLIENT: Optional[DatabaseClient] = None
+_CONNECTOR_MAP: Mapping[str, Type] = MappingProxyType({
+    "AZURE_SQL": AzureSQLConnector,
+    "POSTGRESQL": PostgreSQLConnector,
+    "ODBC": OdbcConnector,
+    "SNOWFLAKE": SnowflakeConnector,
+    "DATABRICKS": DatabricksConnector,
+})
+# SQL_CONNECTOR_CONFIG keys forwarded to PooledConnector instead of the connector;
+# raise pool_size to allow more concurrent queries per process.
+_POOL_OPTIONS = frozenset({"pool_size", "max_overflow", "pool_timeout", "pool_recycle"})
 
 
-def _build_connector(config: Dict[str, Any]):
+def _resolve_connector(config: Mapping[str, Any]) -> Tuple[Type, Mapping[str, Any], Mapping[str, Any]]:
     connector_type = (config.get("type") or "").upper()
     if not connector_type:
         raise ValueError("Connector configuration must include a 'type' key.")
 
-    connector_map = {
-        "AZURE_SQL": AzureSQLConnector,
-        "POSTGRESQL": PostgreSQLConnector,
-        "ODBC": OdbcConnector,
-        "SNOWFLAKE": SnowflakeConnector,
-        "DATABRICKS": DatabricksConnector,
-    }
-
-    connector_cls = connector_map.get(connector_type)
+    connector_cls = _CONNECTOR_MAP.get(connector_type)
     if connector_cls is None:
         raise ValueError(f"Unsupported connector type '{connector_type}'.")
 
-    kwargs = {k: v for k, v in config.items() if k != "type"}
-    return connector_cls(**kwargs)
+    kwargs = MappingProxyType(
+        {k: v for k, v in config.items() if k != "type" and k not in _POOL_OPTIONS}
+    )
+    pool_kwargs = MappingProxyType({k: v for k, v in config.items() if k in _POOL_OPTIONS})
+    return connector_cls, kwargs, pool_kwargs
+
+
+# Parse and resolve the connector configuration once per worker process.
+_CONNECTOR_CONFIG_RAW = os.environ.get("SQL_CONNECTOR_CONFIG")
+_CONNECTOR_SPEC: Optional[Tuple[Type, Mapping[str, Any], Mapping[str, Any]]] = None
+if _CONNECTOR_CONFIG_RAW:
+    try:
+        _CONNECTOR_SPEC = _resolve_connector(MappingProxyType(json.loads(_CONNECTOR_CONFIG_RAW)))
+    except json.JSONDecodeError as exc:
+        logging.error("Failed to parse SQL_CONNECTOR_CONFIG: %s", exc)
+    except ValueError as exc:
+        logging.error("Invalid SQL_CONNECTOR_CONFIG: %s", exc)
+
+_SQL_CLIENT: Optional[DatabaseClient] = None
+
+
+def _build_connector():
+    connector_cls, kwargs, pool_kwargs = _CONNECTOR_SPEC
+    return PooledConnector(connector_cls(**kwargs), **pool_kwargs)
 
 
 def _get_sql_client() -> DatabaseClient:
     global _SQL_CLIENT
     if _SQL_CLIENT is None:
-        if not _CONNECTOR_CONFIG:
+        if _CONNECTOR_SPEC is None:
             raise RuntimeError("SQL_CONNECTOR_CONFIG environment variable is not set or invalid.")
-        connector = _build_connector(_CONNECTOR_CONFIG)
-        _SQL_CLIENT = DatabaseClient(connector)
+        _SQL_CLIENT = DatabaseClient(_build_connector())
     return _SQL_CLIENT
 
 
 def _reset_client():
     global _SQL_CLIENT
+    if _SQL_CLIENT is not None and isinstance(_SQL_CLIENT.connector, PooledConnector):
+        _SQL_CLIENT.connector.dispose()
     _SQL_CLIENT = None
 
 
+def _handle_error(exc: Exception):
+    """
+    Drop the cached client only when its pinned connection died. Pooled clients
+    already invalidated the broken connection in DatabaseClient._read_sql, so the
+    pool (and its healthy connections) is kept.
+    """
+    client = _SQL_CLIENT
+    if client is None or isinstance(client.connector, PooledConnector):
+        return
+    if is_connection_error(exc):
+        _reset_client()
+
+
 @app.route(route="sql/tables", methods=["GET"], auth_level=func.AuthLevel.ANONYMOUS)
 def list_tables(req: func.HttpRequest) -> func.HttpResponse:
     try:
@@ -73,7 +106,7 @@ def list_tables(req: func.HttpRequest) -> func.HttpResponse:
         return func.HttpResponse(tables_json, mimetype="application/json")
     except Exception as exc:  # pylint: disable=broad-except
         logging.exception("Failed to list tables: %s", exc)
-        _reset_client()
+        _handle_error(exc)
         return func.HttpResponse(str(exc), status_code=500)
 
 
@@ -89,7 +122,7 @@ def get_schema(req: func.HttpRequest) -> func.HttpResponse:
         return func.HttpResponse(schema_json, mimetype="application/json")
     except Exception as exc:  # pylint: disable=broad-except
         logging.exception("Failed to fetch schema: %s", exc)
-        _reset_client()
+        _handle_error(exc)
         return func.HttpResponse(str(exc), status_code=500)
 
 
@@ -109,12 +142,13 @@ def run_query(req: func.HttpRequest) -> func.HttpResponse:
     try:
         client = _get_sql_client()
         df = client._read_sql(query)  # pylint: disable=protected-access
-        df = client.convert_datetime_columns_to_string(df)
     except Exception as exc:  # pylint: disable=broad-except
         logging.exception("SQL query failed: %s", exc)
-        _reset_client()
+        _handle_error(exc)
         return func.HttpResponse(str(exc), status_code=500)
 
+    # Both sinks below render datetimes natively (to_csv and orjson/json_default),
+    # so the frame is not passed through convert_datetime_columns_to_string.
     row_count = len(df.index)
     response_payload = {
         "rowCount": row_count,
@@ -123,13 +157,24 @@ def run_query(req: func.HttpRequest) -> func.HttpResponse:
     }
 
     if row_count > 10:
-        buffer = io.StringIO()
-        df.to_csv(buffer, index=False)
-        csv_bytes = buffer.getvalue().encode("utf-8")
-        buffer.close()
-
-        encoded_csv = base64.b64encode(csv_bytes).decode("utf-8")
         filename = desired_filename or f"query_result_{uuid.uuid4().hex}.csv"
+        # Write UTF-8 CSV bytes straight into a binary buffer, avoiding intermediate
+        # str and bytes copies of the whole result.
+        with io.BytesIO() as buffer:
+            df.to_csv(buffer, index=False, encoding="utf-8")
+            if "text/csv" in (req.headers.get("Accept") or ""):
+                # Callers that accept CSV get the file as the body, so no base64 copy
+                # or JSON wrapper is ever built.
+                return func.HttpResponse(
+                    body=buffer.getvalue(),
+                    mimetype="text/csv",
+                    status_code=200,
+                    headers={
+                        "Content-Disposition": f'attachment; filename="{filename}"',
+                        "X-Row-Count": str(row_count),
+                    },
+                )
+            encoded_csv = base64.b64encode(buffer.getbuffer()).decode("ascii")
 
         response_payload["openaiFileResponse"].append(encoded_csv)
         response_payload["fileName"] = filename
@@ -137,4 +182,4 @@ def run_query(req: func.HttpRequest) -> func.HttpResponse:
     else:
         response_payload["rows"] = df.to_dict(orient="records")
 
-    return func.HttpResponse(json.dumps(response_payload), mimetype="application/json", status_code=200)
+    return func.HttpResponse(dumps_json(response_payload), mimetype="application/json", status_code=200)
@@ -0,0 +1,17 @@
+import datetime
+
+import pandas as pd
+
+from sqltoolkit.client import DatabaseClient
+
+
+def test_convert_datetime_columns_to_string_keeps_nulls():
+    df = pd.DataFrame({
+        "ts": pd.to_datetime(["2023-01-02 03:04:05", None]),
+        "day": pd.Series([datetime.date(2023, 1, 2), None], dtype=object),
+    })
+
+    df = DatabaseClient.convert_datetime_columns_to_string(df)
+
+    assert df["ts"].tolist() == ["2023-01-02 03:04:05", None]
+    assert df["day"].tolist() == ["2023-01-02", None]
@@ -0,0 +1,24 @@
+import psycopg2
+import psycopg2.extensions
+import pyodbc
+
+from sqltoolkit.connectors import is_connection_error
+
+
+def _wrapped(exc):
+    # pandas.read_sql re-raises driver errors as DatabaseError(...) from exc.
+    try:
+        raise RuntimeError("Execution failed") from exc
+    except RuntimeError as wrapper:
+        return wrapper
+
+
+def test_dead_connection_errors_are_connection_errors():
+    assert is_connection_error(pyodbc.OperationalError("08S01", "Communication link failure"))
+    assert is_connection_error(_wrapped(psycopg2.InterfaceError("connection already closed")))
+
+
+def test_query_timeouts_are_not_connection_errors():
+    assert not is_connection_error(pyodbc.OperationalError("HYT00", "Query timeout expired"))
+    assert not is_connection_error(_wrapped(psycopg2.extensions.QueryCanceledError("canceling statement")))
+    assert not is_connection_error(pyodbc.ProgrammingError("42S02", "Invalid object name"))
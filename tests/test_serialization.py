@@ -0,0 +1,35 @@
+import decimal
+
+import orjson
+import pandas as pd
+
+from sqltoolkit.serialization import dumps_json
+
+
+def test_dumps_json_round_trips_small_floats_and_decimals():
+    df = pd.DataFrame({
+        "small": [2.5e-11, 3.141592653589793],
+        "amount": [decimal.Decimal("0.00000000001"), decimal.Decimal("1234.5678")],
+    })
+
+    rows = orjson.loads(dumps_json(df.to_dict(orient="records")))
+
+    assert rows == [
+        {"small": 2.5e-11, "amount": 1e-11},
+        {"small": 3.141592653589793, "amount": 1234.5678},
+    ]
+
+
+def test_dumps_json_serializes_missing_values_as_null():
+    df = pd.DataFrame({
+        "id": pd.array([1, None], dtype="Int64"),
+        "ratio": [0.5, float("nan")],
+        "ts": pd.to_datetime(["2023-01-02 03:04:05.123456", None]),
+    })
+
+    rows = orjson.loads(dumps_json(df.to_dict(orient="records")))
+
+    assert rows == [
+        {"id": 1, "ratio": 0.5, "ts": "2023-01-02T03:04:05.123456"},
+        {"id": None, "ratio": None, "ts": None},
+    ]